@@ -5,7 +5,9 @@ import logging
 from typing import Any
 
 import voluptuous as vol
+from aiohttp import ClientSession
 
+from homeassistant.components import persistent_notification
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.exceptions import HomeAssistantError
@@ -15,21 +17,39 @@ from .api import SolarEdgeControllerApiClient
 from .const import (
     ATTR_AUTO_MODE,
     ATTR_AUTO_MODE_THRESHOLD,
+    ATTR_DURATION,
     ATTR_ENTRY_ID,
     ATTR_LIMIT_EXPORT,
     ATTR_POWER_LIMIT_W,
+    CONF_ALIGN_POLLING,
     CONF_BASE_URL,
+    CONF_EXPORT_FLUSH_INTERVAL,
+    CONF_EXPORT_PATH,
+    CONF_EXPORT_TARGET,
+    CONF_EXPORT_TOKEN,
+    CONF_EXPORT_URL,
+    CONF_LOOP_BUDGET_MS,
     CONF_SCAN_INTERVAL,
     CONF_TIMEOUT,
     CONF_TOKEN,
     CONF_VERIFY_SSL,
+    DEFAULT_ALIGN_POLLING,
+    DEFAULT_EXPORT_FLUSH_INTERVAL,
+    DEFAULT_LOOP_BUDGET_MS,
+    DEFAULT_PROFILE_DURATION,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_TIMEOUT,
     DOMAIN,
+    EXPORT_TARGET_FILE,
+    EXPORT_TARGET_INFLUX,
+    EXPORT_TARGET_NONE,
     PLATFORMS,
+    SERVICE_PROFILE,
     SERVICE_SET_CONTROL,
 )
 from .coordinator import SolarEdgeControllerCoordinator
+from .exporter import InfluxLineProtocolSink, RollingFileSink, SolarEdgeControllerExporter
+from .profiler import LoopBudget, async_profile
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -43,6 +63,15 @@ SERVICE_SCHEMA = vol.Schema(
     }
 )
 
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): str,
+        vol.Optional(ATTR_DURATION, default=DEFAULT_PROFILE_DURATION): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=3600)
+        ),
+    }
+)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up SolarEdgeController from a config entry."""
@@ -56,6 +85,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     timeout: int = entry.options.get(CONF_TIMEOUT, DEFAULT_TIMEOUT)
     scan_interval: int = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    align_polling: bool = entry.options.get(CONF_ALIGN_POLLING, DEFAULT_ALIGN_POLLING)
+    loop_budget_ms: int = entry.options.get(CONF_LOOP_BUDGET_MS, DEFAULT_LOOP_BUDGET_MS)
 
     api = SolarEdgeControllerApiClient(
         session=session,
@@ -63,22 +94,40 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         token=token,
         verify_ssl=verify_ssl,
         timeout=timeout,
+        loop_budget=LoopBudget(loop_budget_ms),
     )
 
     coordinator = SolarEdgeControllerCoordinator(
         hass=hass,
         api=api,
         scan_interval=scan_interval,
+        align=align_polling,
     )
 
-    await coordinator.async_config_entry_first_refresh()
+    exporter = _create_exporter(hass, entry, session, timeout)
+    if exporter is not None:
+        coordinator.exporter = exporter
+        await exporter.async_start()
+
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        if exporter is not None:
+            await exporter.async_stop()
+        raise
 
     hass.data[DOMAIN][entry.entry_id] = {
         "api": api,
         "coordinator": coordinator,
         "entry": entry,
+        "exporter": exporter,
     }
 
+    coordinator.async_start_aligned_polling()
+    entry.async_on_unload(coordinator.async_stop_aligned_polling)
+    # Options (exporter, alignment, loop budget) are read at setup; reload to apply changes
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     # Optional service (advanced users)
@@ -123,12 +172,77 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             schema=SERVICE_SCHEMA,
         )
 
+    if not hass.services.has_service(DOMAIN, SERVICE_PROFILE):
+
+        async def _handle_profile(call: ServiceCall) -> None:
+            entry_id = call.data.get(ATTR_ENTRY_ID)
+            loaded = hass.data.get(DOMAIN, {})
+
+            if entry_id and entry_id not in loaded:
+                raise HomeAssistantError(f"SolarEdgeController entry '{entry_id}' is not loaded.")
+            targets = [entry_id] if entry_id else list(loaded.keys())
+            if not targets:
+                raise HomeAssistantError("No SolarEdgeController config entries are loaded.")
+
+            timings = {tid: loaded[tid]["api"].timings for tid in targets}
+            profile_path, summary_path = await async_profile(hass, timings, call.data[ATTR_DURATION])
+
+            persistent_notification.async_create(
+                hass,
+                f"Profile: `{profile_path}`\n\nSummary: `{summary_path}`",
+                title="SolarEdgeController profile finished",
+                notification_id=f"{DOMAIN}_profile",
+            )
+
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_PROFILE,
+            _handle_profile,
+            schema=PROFILE_SCHEMA,
+        )
+
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        data = hass.data[DOMAIN].pop(entry.entry_id, None) or {}
+        exporter: SolarEdgeControllerExporter | None = data.get("exporter")
+        if exporter is not None:
+            await exporter.async_stop()
     return unload_ok
+
+
+def _create_exporter(
+    hass: HomeAssistant, entry: ConfigEntry, session: ClientSession, timeout: int
+) -> SolarEdgeControllerExporter | None:
+    """Build the optional time-series exporter from entry options."""
+    target = entry.options.get(CONF_EXPORT_TARGET, EXPORT_TARGET_NONE)
+
+    if target == EXPORT_TARGET_INFLUX and entry.options.get(CONF_EXPORT_URL):
+        sink = InfluxLineProtocolSink(
+            session,
+            entry.options[CONF_EXPORT_URL],
+            token=entry.options.get(CONF_EXPORT_TOKEN, ""),
+            timeout=timeout,
+        )
+    elif target == EXPORT_TARGET_FILE and entry.options.get(CONF_EXPORT_PATH):
+        sink = RollingFileSink(hass, hass.config.path(entry.options[CONF_EXPORT_PATH]))
+    else:
+        if target != EXPORT_TARGET_NONE:
+            _LOGGER.warning("Exporter target '%s' is missing its URL/path; export disabled", target)
+        return None
+
+    return SolarEdgeControllerExporter(
+        hass,
+        sink,
+        source=entry.unique_id or entry.entry_id,
+        flush_interval=entry.options.get(CONF_EXPORT_FLUSH_INTERVAL, DEFAULT_EXPORT_FLUSH_INTERVAL),
+    )
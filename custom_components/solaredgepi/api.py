@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import asyncio
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from aiohttp import ClientError, ClientResponseError, ClientSession
 
+from .const import DEFAULT_OFFLOAD_THRESHOLD_BYTES
+from .profiler import LoopBudget, PhaseTimings
+
 
 class SolarEdgeControllerApiError(Exception):
     """Base error for API problems."""
@@ -23,6 +26,25 @@ class SolarEdgeControllerApiClient:
     token: str
     verify_ssl: bool
     timeout: int = 10
+    timings: PhaseTimings = field(default_factory=PhaseTimings, compare=False)
+    loop_budget: LoopBudget = field(default_factory=LoopBudget, compare=False)
+    offload_threshold: int = DEFAULT_OFFLOAD_THRESHOLD_BYTES
+
+    # Single-flight state: one shared in-flight GET per endpoint path
+    _inflight: dict[str, asyncio.Task] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _stats: dict[str, int] = field(
+        default_factory=lambda: {"requests": 0, "deduplicated": 0}, init=False, repr=False, compare=False
+    )
+
+    @property
+    def deduplicated_requests(self) -> int:
+        """Number of GETs that joined an already in-flight request instead of issuing their own."""
+        return self._stats["deduplicated"]
+
+    @property
+    def request_stats(self) -> dict[str, int]:
+        """GETs issued vs. joined onto an in-flight request."""
+        return dict(self._stats)
 
     def _url(self, path: str) -> str:
         return f"{self.base_url.rstrip('/')}{path}"
@@ -37,53 +59,94 @@ class SolarEdgeControllerApiClient:
         # aiohttp: ssl=False disables certificate verification (useful for self-signed certs)
         return None if self.verify_ssl else False
 
-    async def async_get_status(self) -> dict[str, Any]:
-        """GET /status/json (not auth-protected in controller)."""
+    async def _async_request(self, method: str, path: str, *, check_auth: bool, **kwargs: Any) -> Any:
+        """Issue a request and decode the JSON body, mapping transport errors to API errors."""
+        timings = self.timings
         try:
-            async with self.session.get(
-                self._url("/status/json"),
-                headers=self._headers(),
-                ssl=self._ssl_param(),
-                timeout=self.timeout,
-            ) as resp:
-                resp.raise_for_status()
-                return await resp.json()
-        except (asyncio.TimeoutError, ClientResponseError, ClientError, json.JSONDecodeError) as err:
+            with timings.measure("network"):
+                async with self.session.request(
+                    method,
+                    self._url(path),
+                    ssl=self._ssl_param(),
+                    timeout=self.timeout,
+                    **kwargs,
+                ) as resp:
+                    if check_auth and resp.status in (401, 403):
+                        raise SolarEdgeControllerAuthError("Unauthorized")
+                    resp.raise_for_status()
+                    # Same content-type check resp.json() applies
+                    if not resp.content_type.endswith("json"):
+                        raise SolarEdgeControllerApiError(
+                            f"Unexpected content type '{resp.content_type}' from {path}"
+                        )
+                    body = await resp.read()
+            with timings.measure("decode"):
+                if len(body) > self.offload_threshold:
+                    # Large payloads would stall the event loop while parsing
+                    return await asyncio.get_running_loop().run_in_executor(None, _decode_json, body)
+                if method != "GET":
+                    return _decode_json(body)
+                # Only reads belong to an update cycle's loop budget
+                with self.loop_budget.hold("decode"):
+                    return _decode_json(body)
+        except SolarEdgeControllerApiError:
+            raise
+        # ValueError covers JSONDecodeError and UnicodeDecodeError from non-UTF-8 bodies
+        except (asyncio.TimeoutError, ClientResponseError, ClientError, ValueError) as err:
             raise SolarEdgeControllerApiError(str(err)) from err
 
+    async def _async_get_shared(self, path: str, *, check_auth: bool) -> Any:
+        """GET `path`, sharing one in-flight request among all concurrent callers.
+
+        Every waiter receives the same decoded object (treat it as read-only) or the same error.
+        The request runs as its own task so a cancelled caller does not abort it for the others.
+        """
+        task = self._inflight.get(path)
+        if task is not None:
+            self._stats["deduplicated"] += 1
+        else:
+            self._stats["requests"] += 1
+            task = asyncio.ensure_future(
+                self._async_request("GET", path, check_auth=check_auth, headers=self._headers())
+            )
+            self._inflight[path] = task
+            task.add_done_callback(lambda t: self._on_shared_done(path, t))
+        return await asyncio.shield(task)
+
+    def _on_shared_done(self, path: str, task: asyncio.Task) -> None:
+        if self._inflight.get(path) is task:
+            del self._inflight[path]
+        # Mark the exception retrieved even if every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def async_get_status(self) -> dict[str, Any]:
+        """GET /status/json (not auth-protected in controller)."""
+        return await self._async_get_shared("/status/json", check_auth=False)
+
     async def async_get_sensors(self) -> dict[str, Any]:
         """GET /sensors (auth-protected; may return 503 while inverter identity initializes)."""
-        try:
-            async with self.session.get(
-                self._url("/sensors"),
-                headers=self._headers(),
-                ssl=self._ssl_param(),
-                timeout=self.timeout,
-            ) as resp:
-                if resp.status in (401, 403):
-                    raise SolarEdgeControllerAuthError("Unauthorized")
-                resp.raise_for_status()
-                return await resp.json()
-        except SolarEdgeControllerAuthError:
-            raise
-        except (asyncio.TimeoutError, ClientResponseError, ClientError, json.JSONDecodeError) as err:
-            raise SolarEdgeControllerApiError(str(err)) from err
+        return await self._async_get_shared("/sensors", check_auth=True)
 
     async def async_set_control(self, payload: dict[str, Any]) -> dict[str, Any]:
         """POST /control (auth-protected)."""
         try:
-            async with self.session.post(
-                self._url("/control"),
-                headers={**self._headers(), "Content-Type": "application/json"},
-                json=payload,
-                ssl=self._ssl_param(),
-                timeout=self.timeout,
-            ) as resp:
-                if resp.status in (401, 403):
-                    raise SolarEdgeControllerAuthError("Unauthorized")
-                resp.raise_for_status()
-                return await resp.json()
-        except SolarEdgeControllerAuthError:
-            raise
-        except (asyncio.TimeoutError, ClientResponseError, ClientError, json.JSONDecodeError) as err:
-            raise SolarEdgeControllerApiError(str(err)) from err
+            with self.timings.measure("control"):
+                return await self._async_request(
+                    "POST",
+                    "/control",
+                    check_auth=True,
+                    headers={**self._headers(), "Content-Type": "application/json"},
+                    json=payload,
+                )
+        finally:
+            # GETs already in flight were sent before this write and may carry stale control
+            # values; refreshes after the write must issue their own request
+            self._inflight.clear()
+
+
+def _decode_json(body: bytes) -> Any:
+    """Decode a JSON body; an empty body yields None like resp.json()."""
+    if not body.strip():
+        return None
+    return json.loads(body)
@@ -11,15 +11,34 @@ from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import SolarEdgeControllerApiClient, SolarEdgeControllerApiError, SolarEdgeControllerAuthError
 from .const import (
+    CONF_ALIGN_POLLING,
     CONF_BASE_URL,
+    CONF_EXPORT_FLUSH_INTERVAL,
+    CONF_EXPORT_PATH,
+    CONF_EXPORT_TARGET,
+    CONF_EXPORT_TOKEN,
+    CONF_EXPORT_URL,
+    CONF_LOOP_BUDGET_MS,
+    CONF_PORTS,
     CONF_SCAN_INTERVAL,
+    CONF_SCHEME,
+    CONF_SUBNET,
     CONF_TIMEOUT,
     CONF_TOKEN,
     CONF_VERIFY_SSL,
+    DEFAULT_ALIGN_POLLING,
+    DEFAULT_EXPORT_FLUSH_INTERVAL,
+    DEFAULT_LOOP_BUDGET_MS,
+    DEFAULT_PORTS,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SCHEME,
+    DEFAULT_SUBNET,
     DEFAULT_TIMEOUT,
     DOMAIN,
+    EXPORT_TARGET_NONE,
+    EXPORT_TARGETS,
 )
+from .discovery import DiscoveredController, async_discover_controllers, candidate_urls
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,7 +46,14 @@ _LOGGER = logging.getLogger(__name__)
 class SolarEdgeControllerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
 
+    def __init__(self) -> None:
+        self._discovered: list[DiscoveredController] = []
+        self._discovery_input: dict[str, Any] = {}
+
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        return self.async_show_menu(step_id="user", menu_options=["discover", "manual"])
+
+    async def async_step_manual(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         errors: dict[str, str] = {}
 
         if user_input is not None:
@@ -35,63 +61,131 @@ class SolarEdgeControllerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             token: str = user_input[CONF_TOKEN]
             verify_ssl: bool = user_input[CONF_VERIFY_SSL]
 
-            session = async_get_clientsession(self.hass)
-            api = SolarEdgeControllerApiClient(
-                session=session,
-                base_url=base_url,
-                token=token,
-                verify_ssl=verify_ssl,
-                timeout=DEFAULT_TIMEOUT,
-            )
+            await self._async_validate(base_url, token, verify_ssl, errors)
+            if not errors:
+                return await self._async_create(base_url, token, verify_ssl)
+
+        schema = vol.Schema(
+            {
+                vol.Required(CONF_BASE_URL, default=(user_input or {}).get(CONF_BASE_URL, "")): str,
+                vol.Required(CONF_TOKEN, default=(user_input or {}).get(CONF_TOKEN, "")): str,
+                vol.Required(CONF_VERIFY_SSL, default=(user_input or {}).get(CONF_VERIFY_SSL, True)): bool,
+            }
+        )
 
+        return self.async_show_form(step_id="manual", data_schema=schema, errors=errors)
+
+    async def async_step_discover(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            self._discovery_input = user_input
             try:
-                # /status/json is intentionally not auth-protected (in controller server.py).
-                await api.async_get_status()
-
-                # Validate token by hitting /sensors (auth protected), but allow 503 during identity init.
-                try:
-                    await api.async_get_sensors()
-                except SolarEdgeControllerAuthError:
-                    raise
-                except SolarEdgeControllerApiError as err:
-                    # /sensors returns 503 while inverter identity registers are not ready.
-                    # Treat as OK for setup; entities will appear once /sensors stabilizes.
-                    _LOGGER.debug("/sensors not ready yet during setup: %s", err)
+                ports = [int(p) for p in str(user_input[CONF_PORTS]).replace(" ", "").split(",") if p]
+                if not ports or any(not 0 < p < 65536 for p in ports):
+                    raise ValueError("invalid port")
+                urls = candidate_urls(user_input[CONF_SUBNET], ports, user_input[CONF_SCHEME])
+                if not urls:
+                    raise ValueError("no hosts in subnet")
+            except ValueError:
+                errors["base"] = "invalid_subnet"
+            else:
+                configured = self._async_current_ids()
+                found = await async_discover_controllers(async_get_clientsession(self.hass), urls)
+                self._discovered = [c for c in found if c.base_url not in configured]
+                if self._discovered:
+                    return await self.async_step_pick()
+                errors["base"] = "no_controllers_found"
+
+        defaults = self._discovery_input
+        schema = vol.Schema(
+            {
+                vol.Required(CONF_SUBNET, default=defaults.get(CONF_SUBNET, DEFAULT_SUBNET)): str,
+                vol.Required(CONF_PORTS, default=defaults.get(CONF_PORTS, DEFAULT_PORTS)): str,
+                vol.Required(CONF_SCHEME, default=defaults.get(CONF_SCHEME, DEFAULT_SCHEME)): vol.In(
+                    ["http", "https"]
+                ),
+            }
+        )
 
-            except SolarEdgeControllerAuthError:
-                errors["base"] = "invalid_auth"
-            except SolarEdgeControllerApiError:
-                errors["base"] = "cannot_connect"
-            except Exception:  # pragma: no cover
-                _LOGGER.exception("Unexpected error")
-                errors["base"] = "unknown"
+        return self.async_show_form(step_id="discover", data_schema=schema, errors=errors)
 
+    async def async_step_pick(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            base_url: str = user_input[CONF_BASE_URL]
+            token: str = user_input[CONF_TOKEN]
+            verify_ssl: bool = user_input[CONF_VERIFY_SSL]
+
+            await self._async_validate(base_url, token, verify_ssl, errors)
             if not errors:
-                await self.async_set_unique_id(base_url)
-                self._abort_if_unique_id_configured()
-
-                return self.async_create_entry(
-                    title=f"SolarEdgeController ({base_url})",
-                    data={
-                        CONF_BASE_URL: base_url,
-                        CONF_TOKEN: token,
-                        CONF_VERIFY_SSL: verify_ssl,
-                    },
-                    options={
-                        CONF_TIMEOUT: DEFAULT_TIMEOUT,
-                        CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
-                    },
-                )
+                return await self._async_create(base_url, token, verify_ssl)
 
+        choices = {
+            c.base_url: f"{c.base_url} ({c.inverter_max_power_w} W)" if c.inverter_max_power_w else c.base_url
+            for c in self._discovered
+        }
         schema = vol.Schema(
             {
-                vol.Required(CONF_BASE_URL, default=(user_input or {}).get(CONF_BASE_URL, "")): str,
+                vol.Required(
+                    CONF_BASE_URL, default=(user_input or {}).get(CONF_BASE_URL, next(iter(choices)))
+                ): vol.In(choices),
                 vol.Required(CONF_TOKEN, default=(user_input or {}).get(CONF_TOKEN, "")): str,
-                vol.Required(CONF_VERIFY_SSL, default=(user_input or {}).get(CONF_VERIFY_SSL, True)): bool,
+                vol.Required(CONF_VERIFY_SSL, default=(user_input or {}).get(CONF_VERIFY_SSL, False)): bool,
             }
         )
 
-        return self.async_show_form(step_id="user", data_schema=schema, errors=errors)
+        return self.async_show_form(step_id="pick", data_schema=schema, errors=errors)
+
+    async def _async_validate(self, base_url: str, token: str, verify_ssl: bool, errors: dict[str, str]) -> None:
+        session = async_get_clientsession(self.hass)
+        api = SolarEdgeControllerApiClient(
+            session=session,
+            base_url=base_url,
+            token=token,
+            verify_ssl=verify_ssl,
+            timeout=DEFAULT_TIMEOUT,
+        )
+
+        try:
+            # /status/json is intentionally not auth-protected (in controller server.py).
+            await api.async_get_status()
+
+            # Validate token by hitting /sensors (auth protected), but allow 503 during identity init.
+            try:
+                await api.async_get_sensors()
+            except SolarEdgeControllerAuthError:
+                raise
+            except SolarEdgeControllerApiError as err:
+                # /sensors returns 503 while inverter identity registers are not ready.
+                # Treat as OK for setup; entities will appear once /sensors stabilizes.
+                _LOGGER.debug("/sensors not ready yet during setup: %s", err)
+
+        except SolarEdgeControllerAuthError:
+            errors["base"] = "invalid_auth"
+        except SolarEdgeControllerApiError:
+            errors["base"] = "cannot_connect"
+        except Exception:  # pragma: no cover
+            _LOGGER.exception("Unexpected error")
+            errors["base"] = "unknown"
+
+    async def _async_create(self, base_url: str, token: str, verify_ssl: bool) -> FlowResult:
+        await self.async_set_unique_id(base_url)
+        self._abort_if_unique_id_configured()
+
+        return self.async_create_entry(
+            title=f"SolarEdgeController ({base_url})",
+            data={
+                CONF_BASE_URL: base_url,
+                CONF_TOKEN: token,
+                CONF_VERIFY_SSL: verify_ssl,
+            },
+            options={
+                CONF_TIMEOUT: DEFAULT_TIMEOUT,
+                CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
+            },
+        )
 
     @staticmethod
     @config_entries.callback
@@ -117,6 +211,34 @@ class SolarEdgeControllerOptionsFlow(config_entries.OptionsFlow):
                     CONF_SCAN_INTERVAL,
                     default=self.config_entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
                 ): vol.Coerce(int),
+                vol.Required(
+                    CONF_ALIGN_POLLING,
+                    default=self.config_entry.options.get(CONF_ALIGN_POLLING, DEFAULT_ALIGN_POLLING),
+                ): bool,
+                vol.Required(
+                    CONF_LOOP_BUDGET_MS,
+                    default=self.config_entry.options.get(CONF_LOOP_BUDGET_MS, DEFAULT_LOOP_BUDGET_MS),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                vol.Required(
+                    CONF_EXPORT_TARGET,
+                    default=self.config_entry.options.get(CONF_EXPORT_TARGET, EXPORT_TARGET_NONE),
+                ): vol.In(EXPORT_TARGETS),
+                vol.Optional(
+                    CONF_EXPORT_URL,
+                    default=self.config_entry.options.get(CONF_EXPORT_URL, ""),
+                ): str,
+                vol.Optional(
+                    CONF_EXPORT_TOKEN,
+                    default=self.config_entry.options.get(CONF_EXPORT_TOKEN, ""),
+                ): str,
+                vol.Optional(
+                    CONF_EXPORT_PATH,
+                    default=self.config_entry.options.get(CONF_EXPORT_PATH, ""),
+                ): str,
+                vol.Required(
+                    CONF_EXPORT_FLUSH_INTERVAL,
+                    default=self.config_entry.options.get(CONF_EXPORT_FLUSH_INTERVAL, DEFAULT_EXPORT_FLUSH_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
             }
         )
 
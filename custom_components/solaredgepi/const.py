@@ -9,13 +9,17 @@ CONF_TOKEN = "token"
 CONF_VERIFY_SSL = "verify_ssl"
 CONF_TIMEOUT = "timeout"
 CONF_SCAN_INTERVAL = "scan_interval"
+CONF_ALIGN_POLLING = "align_polling"
 
 DEFAULT_TIMEOUT = 10
 DEFAULT_SCAN_INTERVAL = 10  # seconds
+DEFAULT_ALIGN_POLLING = False
+JITTER_WINDOW = 500  # aligned polls kept for jitter percentiles
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.SWITCH, Platform.NUMBER]
 
 SERVICE_SET_CONTROL = "set_control"
+SERVICE_PROFILE = "profile"
 
 ATTR_ENTRY_ID = "entry_id"
 # Attributes for controll limit_export, auto_mode, auto_mode_threshold, power_limit_W
@@ -23,3 +27,42 @@ ATTR_LIMIT_EXPORT = "limit_export"
 ATTR_AUTO_MODE = "auto_mode"
 ATTR_AUTO_MODE_THRESHOLD = "auto_mode_threshold"
 ATTR_POWER_LIMIT_W = "power_limit_W"
+# Attributes for the profile service
+ATTR_DURATION = "duration"
+
+DEFAULT_PROFILE_DURATION = 60  # seconds
+
+# Optional time-series exporter
+CONF_EXPORT_TARGET = "export_target"
+CONF_EXPORT_URL = "export_url"
+CONF_EXPORT_TOKEN = "export_token"
+CONF_EXPORT_PATH = "export_path"
+CONF_EXPORT_FLUSH_INTERVAL = "export_flush_interval"
+
+EXPORT_TARGET_NONE = "none"
+EXPORT_TARGET_INFLUX = "influx"
+EXPORT_TARGET_FILE = "file"
+EXPORT_TARGETS = [EXPORT_TARGET_NONE, EXPORT_TARGET_INFLUX, EXPORT_TARGET_FILE]
+
+DEFAULT_EXPORT_FLUSH_INTERVAL = 30  # seconds
+DEFAULT_EXPORT_BUFFER_SIZE = 2000  # samples kept in memory before dropping the oldest
+DEFAULT_EXPORT_BATCH_SIZE = 200  # samples per flush
+DEFAULT_EXPORT_FILE_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_EXPORT_FILE_BACKUPS = 5
+
+# LAN discovery (config flow)
+CONF_SUBNET = "subnet"
+CONF_PORTS = "ports"
+CONF_SCHEME = "scheme"
+
+DEFAULT_SUBNET = "192.168.1.0/24"
+DEFAULT_PORTS = "8080"
+DEFAULT_SCHEME = "https"
+DEFAULT_DISCOVERY_TIMEOUT = 1.5  # seconds per probe
+DEFAULT_DISCOVERY_CONCURRENCY = 64
+MAX_DISCOVERY_CANDIDATES = 4096  # e.g. a /22 on one port, or a /24 on 16 ports
+
+# Event-loop budget guard
+CONF_LOOP_BUDGET_MS = "loop_budget_ms"
+DEFAULT_LOOP_BUDGET_MS = 50  # on-loop time per update cycle before warning; 0 disables
+DEFAULT_OFFLOAD_THRESHOLD_BYTES = 256 * 1024  # bodies above this are JSON-decoded in the executor
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import math
+import time
+from collections import deque
 from datetime import timedelta
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import SolarEdgeControllerApiClient, SolarEdgeControllerApiError
-from .const import DOMAIN, DEFAULT_SCAN_INTERVAL
+from .const import DOMAIN, DEFAULT_SCAN_INTERVAL, JITTER_WINDOW
+from .exporter import SolarEdgeControllerExporter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -16,27 +21,114 @@ _LOGGER = logging.getLogger(__name__)
 class SolarEdgeControllerCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator fetching both sensors and control state."""
 
-    def __init__(self, hass: HomeAssistant, api: SolarEdgeControllerApiClient, scan_interval: int) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: SolarEdgeControllerApiClient,
+        scan_interval: int,
+        align: bool = False,
+    ) -> None:
+        interval = scan_interval or DEFAULT_SCAN_INTERVAL
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=scan_interval or DEFAULT_SCAN_INTERVAL),
+            # In aligned mode we schedule polls ourselves on wall-clock boundaries
+            update_interval=None if align else timedelta(seconds=interval),
         )
         self.api = api
 
+        self._interval = interval
+        self._align = align
+        self._aligned_handle: asyncio.TimerHandle | None = None
+        self._deadline: float | None = None
+        self._lateness: deque[float] = deque(maxlen=JITTER_WINDOW)
+        self.missed_deadlines = 0
+
         # Best-effort upper bound for power_limit_W:
         # - if controller exposes explicit limits, use those
         # - otherwise keep max observed power_limit_W (controller defaults it to PEAK_PRODUCTION_W at startup)
         self._max_power_w: int | None = None
 
+        # Optional time-series exporter; receives every successful snapshot
+        self.exporter: SolarEdgeControllerExporter | None = None
+
     @property
     def max_power_w(self) -> int | None:
         return self._max_power_w
 
+    @property
+    def poll_stats(self) -> dict[str, Any]:
+        """Missed deadlines and start-jitter percentiles of aligned polls."""
+        samples = sorted(self._lateness)
+        return {
+            "aligned": self._align,
+            "interval_s": self._interval,
+            "polls": len(samples),
+            "missed_deadlines": self.missed_deadlines,
+            "jitter_p50_ms": _percentile(samples, 50),
+            "jitter_p95_ms": _percentile(samples, 95),
+            "jitter_p99_ms": _percentile(samples, 99),
+            "jitter_max_ms": samples[-1] * 1000 if samples else None,
+        }
+
+    @callback
+    def async_start_aligned_polling(self) -> None:
+        """Start polling on wall-clock boundaries (e.g. :00/:05 for a 5 s interval)."""
+        if self._align and self._aligned_handle is None:
+            self._schedule_aligned(None)
+
+    @callback
+    def async_stop_aligned_polling(self) -> None:
+        self._align = False
+        if self._aligned_handle is not None:
+            self._aligned_handle.cancel()
+            self._aligned_handle = None
+
+    @callback
+    def _schedule_aligned(self, previous_deadline: float | None) -> None:
+        # Always derive the next boundary from the wall clock so errors never accumulate
+        now = time.time()
+        deadline = (math.floor(now / self._interval) + 1) * self._interval
+        if previous_deadline is not None:
+            # Never poll the same boundary twice when the timer fired early or the clock stepped
+            # back slightly; after a large backwards step, re-align to the wall clock instead
+            next_after_previous = previous_deadline + self._interval
+            if deadline < next_after_previous <= now + 2 * self._interval:
+                deadline = next_after_previous
+            skipped = round((deadline - previous_deadline) / self._interval) - 1
+            if skipped > 0:
+                self.missed_deadlines += skipped
+                _LOGGER.debug("Missed %d aligned poll deadline(s); last poll overran", skipped)
+        self._aligned_handle = self.hass.loop.call_later(
+            max(0.0, deadline - now), self._on_aligned_deadline, deadline
+        )
+
+    @callback
+    def _on_aligned_deadline(self, deadline: float) -> None:
+        self._aligned_handle = None
+        # Background task: recurring polls must not hold up startup/shutdown waits
+        self.hass.async_create_background_task(
+            self._async_aligned_refresh(deadline), name=f"{DOMAIN} aligned refresh ({self.api.base_url})"
+        )
+
+    async def _async_aligned_refresh(self, deadline: float) -> None:
+        self._lateness.append(max(0.0, time.time() - deadline))
+        self._deadline = deadline
+        try:
+            await self.async_refresh()
+        finally:
+            self._deadline = None
+            if self._align:
+                self._schedule_aligned(deadline)
+
     async def _async_update_data(self) -> dict[str, Any]:
+        scheduled = self._deadline
+        self.api.loop_budget.start()
         try:
+            request_start = time.time()
             status = await self.api.async_get_status()
+            status_received = time.time()
             if not isinstance(status, dict):
                 raise UpdateFailed("Unexpected /status/json response (expected dict)")
 
@@ -50,37 +142,75 @@ class SolarEdgeControllerCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 # Some errors should fail the update; 503 is wrapped as ClientResponseError.
                 # We keep coordinator alive using status-only data and log the issue.
                 _LOGGER.debug("Failed to fetch /sensors this cycle: %s", err)
+            response_received = time.time()
 
-            control = status.get("control") if isinstance(status.get("control"), dict) else {}
-            limits = status.get("limits") if isinstance(status.get("limits"), dict) else {}
+            # Normalization is constant-time (no copying), so it stays on the loop
+            with self.api.timings.measure("normalize"), self.api.loop_budget.hold("normalize"):
+                data = self._normalize(status, sensors)
 
-            # Update max_power_w:
-            # 1) explicit limits if present
-            max_from_limits = None
-            try:
-                max_from_limits = int(limits.get("power_limit_W", {}).get("max"))  # type: ignore[union-attr]
-            except Exception:
-                max_from_limits = None
-
-            if max_from_limits and max_from_limits > 0:
-                self._max_power_w = max_from_limits
-            else:
-                # 2) keep max observed control power_limit_W
-                try:
-                    pl = control.get("power_limit_W")
-                    if pl is not None:
-                        pl_i = int(round(float(pl)))
-                        if pl_i > 0 and (self._max_power_w is None or pl_i > self._max_power_w):
-                            self._max_power_w = pl_i
-                except Exception:
-                    pass
-
-            return {
-                "status": status.get("status", {}) if isinstance(status.get("status"), dict) else {},
-                "history": status.get("history", {}) if isinstance(status.get("history"), dict) else {},
-                "control": control,
-                "limits": limits,
-                "sensors": sensors,
+            # Per-snapshot timestamps; the controller sampled somewhere inside the /status/json
+            # round-trip, so its midpoint is the best estimate of the sample instant
+            latency = status_received - request_start
+            data["timing"] = {
+                "scheduled": scheduled,
+                "request_start": request_start,
+                "response_received": response_received,
+                "latency_s": latency,
+                "sample_time": request_start + latency / 2,
             }
+
+            if self.exporter is not None:
+                self.exporter.async_add_sample(data)
+
+            return data
         except SolarEdgeControllerApiError as err:
             raise UpdateFailed(str(err)) from err
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify entities, then close the cycle's event-loop budget accounting."""
+        with self.api.timings.measure("entity_writes"), self.api.loop_budget.hold("entity_writes"):
+            super().async_update_listeners()
+        self.api.loop_budget.finish(f"{self.api.base_url} update cycle")
+
+    def _normalize(self, status: dict[str, Any], sensors: dict[str, Any]) -> dict[str, Any]:
+        """Shape raw controller responses into coordinator data and track max power."""
+        control = status.get("control") if isinstance(status.get("control"), dict) else {}
+        limits = status.get("limits") if isinstance(status.get("limits"), dict) else {}
+
+        # Update max_power_w:
+        # 1) explicit limits if present
+        max_from_limits = None
+        try:
+            max_from_limits = int(limits.get("power_limit_W", {}).get("max"))  # type: ignore[union-attr]
+        except Exception:
+            max_from_limits = None
+
+        if max_from_limits and max_from_limits > 0:
+            self._max_power_w = max_from_limits
+        else:
+            # 2) keep max observed control power_limit_W
+            try:
+                pl = control.get("power_limit_W")
+                if pl is not None:
+                    pl_i = int(round(float(pl)))
+                    if pl_i > 0 and (self._max_power_w is None or pl_i > self._max_power_w):
+                        self._max_power_w = pl_i
+            except Exception:
+                pass
+
+        return {
+            "status": status.get("status", {}) if isinstance(status.get("status"), dict) else {},
+            "history": status.get("history", {}) if isinstance(status.get("history"), dict) else {},
+            "control": control,
+            "limits": limits,
+            "sensors": sensors,
+        }
+
+
+def _percentile(sorted_samples: list[float], pct: float) -> float | None:
+    """Nearest-rank percentile in milliseconds."""
+    if not sorted_samples:
+        return None
+    idx = max(0, math.ceil(pct / 100 * len(sorted_samples)) - 1)
+    return sorted_samples[idx] * 1000
@@ -0,0 +1,80 @@
+"""Concurrent LAN sweep for SolarEdgeController instances."""
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from aiohttp import ClientSession
+
+from .api import SolarEdgeControllerApiClient, SolarEdgeControllerApiError
+from .const import DEFAULT_DISCOVERY_CONCURRENCY, DEFAULT_DISCOVERY_TIMEOUT, MAX_DISCOVERY_CANDIDATES
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DiscoveredController:
+    base_url: str
+    inverter_max_power_w: int | None = None
+
+
+def candidate_urls(subnet: str, ports: list[int], scheme: str) -> list[str]:
+    """Expand a subnet and port list into base URLs to probe (raises ValueError on bad input)."""
+    network = ipaddress.ip_network(subnet, strict=False)
+    if network.num_addresses * len(ports) > MAX_DISCOVERY_CANDIDATES:
+        raise ValueError(f"Sweep of {subnet} on {len(ports)} port(s) exceeds {MAX_DISCOVERY_CANDIDATES} probes")
+    hosts = [f"[{h}]" if network.version == 6 else str(h) for h in network.hosts()]
+    return [f"{scheme}://{host}:{port}" for host in hosts for port in ports]
+
+
+async def async_discover_controllers(
+    session: ClientSession,
+    base_urls: Iterable[str],
+    *,
+    timeout: float = DEFAULT_DISCOVERY_TIMEOUT,
+    concurrency: int = DEFAULT_DISCOVERY_CONCURRENCY,
+) -> list[DiscoveredController]:
+    """Probe the unauthenticated /status/json of every candidate concurrently.
+
+    Probes are bounded by a semaphore and a short per-probe timeout so a /24 sweep
+    finishes in a few seconds; anything that does not answer like a controller is skipped.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _probe(base_url: str) -> DiscoveredController | None:
+        api = SolarEdgeControllerApiClient(
+            session=session,
+            base_url=base_url,
+            token="",
+            # Only the public status endpoint is probed; certificate checks are chosen at setup
+            verify_ssl=False,
+            timeout=timeout,
+        )
+        async with semaphore:
+            try:
+                status = await api.async_get_status()
+            except SolarEdgeControllerApiError:
+                return None
+            except Exception as err:  # noqa: BLE001
+                # Arbitrary LAN devices answer in arbitrary ways; one odd host must not abort the sweep
+                _LOGGER.debug("Discovery probe of %s failed: %r", base_url, err)
+                return None
+        if not isinstance(status, dict) or not isinstance(status.get("control"), dict):
+            return None
+
+        max_w = None
+        inner = status.get("status")
+        if isinstance(inner, dict):
+            try:
+                max_w = int(inner.get("inverter_max_power_W"))
+            except (TypeError, ValueError):
+                max_w = None
+        return DiscoveredController(base_url=base_url, inverter_max_power_w=max_w)
+
+    results = await asyncio.gather(*(_probe(url) for url in base_urls))
+    found = [r for r in results if r is not None]
+    _LOGGER.debug("Discovery found %d controller(s)", len(found))
+    return found
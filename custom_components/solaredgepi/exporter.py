@@ -0,0 +1,308 @@
+"""Optional batched time-series exporter for coordinator samples."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import os
+import time
+from collections import deque
+from typing import Any, Protocol
+
+from aiohttp import ClientError, ClientResponseError, ClientSession
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    DEFAULT_EXPORT_BATCH_SIZE,
+    DEFAULT_EXPORT_BUFFER_SIZE,
+    DEFAULT_EXPORT_FILE_BACKUPS,
+    DEFAULT_EXPORT_FILE_MAX_BYTES,
+    DEFAULT_EXPORT_FLUSH_INTERVAL,
+    DOMAIN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Sections of the coordinator data exported as one line each; sensors get one line per key
+_SECTIONS = ("status", "control", "limits", "timing")
+
+
+class ExportSink(Protocol):
+    async def async_write(self, lines: list[str]) -> None:
+        """Write a batch of line-protocol lines; raise on failure."""
+
+
+class InfluxLineProtocolSink:
+    """POST batches to an InfluxDB line-protocol write endpoint."""
+
+    def __init__(self, session: ClientSession, url: str, token: str = "", timeout: int = 10) -> None:
+        self._session = session
+        self._url = url
+        self._token = token
+        self._timeout = timeout
+
+    async def async_write(self, lines: list[str]) -> None:
+        headers = {"Content-Type": "text/plain; charset=utf-8"}
+        if self._token:
+            headers["Authorization"] = f"Token {self._token}"
+        async with self._session.post(
+            self._url,
+            data="\n".join(lines).encode(),
+            headers=headers,
+            timeout=self._timeout,
+        ) as resp:
+            resp.raise_for_status()
+
+
+class RollingFileSink:
+    """Append batches to a local file, rotating it when it grows too large.
+
+    All disk I/O runs in the executor so the event loop never blocks on it.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        path: str,
+        max_bytes: int = DEFAULT_EXPORT_FILE_MAX_BYTES,
+        backup_count: int = DEFAULT_EXPORT_FILE_BACKUPS,
+    ) -> None:
+        self._hass = hass
+        self._path = path
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+
+    async def async_write(self, lines: list[str]) -> None:
+        await self._hass.async_add_executor_job(self._write, lines)
+
+    def _write(self, lines: list[str]) -> None:
+        os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
+        try:
+            if os.path.getsize(self._path) >= self._max_bytes:
+                self._rotate()
+        except FileNotFoundError:
+            pass
+        with open(self._path, "a", encoding="utf-8") as fh:
+            fh.write("\n".join(lines) + "\n")
+
+    def _rotate(self) -> None:
+        for i in range(self._backup_count - 1, 0, -1):
+            src = f"{self._path}.{i}"
+            if os.path.exists(src):
+                os.replace(src, f"{self._path}.{i + 1}")
+        if self._backup_count > 0:
+            os.replace(self._path, f"{self._path}.1")
+        else:
+            os.remove(self._path)
+
+
+class SolarEdgeControllerExporter:
+    """Buffer coordinator samples in memory and flush them in batches from a background task.
+
+    The buffer is bounded: when the sink cannot keep up, the oldest samples are dropped and
+    counted instead of growing memory or stalling the coordinator.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        sink: ExportSink,
+        *,
+        source: str,
+        flush_interval: int = DEFAULT_EXPORT_FLUSH_INTERVAL,
+        buffer_size: int = DEFAULT_EXPORT_BUFFER_SIZE,
+        batch_size: int = DEFAULT_EXPORT_BATCH_SIZE,
+    ) -> None:
+        self._hass = hass
+        self._sink = sink
+        self._source = source
+        self._flush_interval = flush_interval or DEFAULT_EXPORT_FLUSH_INTERVAL
+        self._batch_size = batch_size
+        self._buffer: deque[tuple[int, dict[str, Any]]] = deque(maxlen=buffer_size)
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+        self.samples_buffered = 0
+        self.samples_written = 0
+        self.samples_dropped = 0
+        self.flush_errors = 0
+        self._evicting = False
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "pending": len(self._buffer),
+            "buffered": self.samples_buffered,
+            "written": self.samples_written,
+            "dropped": self.samples_dropped,
+            "flush_errors": self.flush_errors,
+        }
+
+    @callback
+    def async_add_sample(self, data: dict[str, Any]) -> None:
+        """Queue one coordinator snapshot; never blocks."""
+        if len(self._buffer) == self._buffer.maxlen:
+            # Appending below evicts the oldest sample
+            self.samples_dropped += 1
+            if not self._evicting:
+                self._evicting = True
+                _LOGGER.warning(
+                    "Exporter buffer full (%d samples); dropping the oldest until the sink catches up",
+                    len(self._buffer),
+                )
+        # Prefer the coordinator's estimated sample instant over the time we happened to receive it
+        sample_time = (data.get("timing") or {}).get("sample_time")
+        ts_ns = int(sample_time * 1e9) if isinstance(sample_time, (int, float)) else time.time_ns()
+        self._buffer.append((ts_ns, data))
+        self.samples_buffered += 1
+        if len(self._buffer) >= self._batch_size:
+            self._wakeup.set()
+
+    async def async_start(self) -> None:
+        if self._task is None:
+            self._task = self._hass.async_create_background_task(
+                self._run(), name=f"{DOMAIN} exporter ({self._source})"
+            )
+
+    async def async_stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        # Best-effort final flush of whatever is still buffered
+        while self._buffer:
+            if not await self._async_flush_batch():
+                break
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            while self._buffer:
+                if not await self._async_flush_batch():
+                    break
+
+    async def _async_flush_batch(self) -> bool:
+        batch = [self._buffer.popleft() for _ in range(min(self._batch_size, len(self._buffer)))]
+        lines: list[str] = []
+        for ts, data in batch:
+            lines.extend(sample_to_lines(data, self._source, ts))
+        if not lines:
+            return True
+        try:
+            await self._sink.async_write(lines)
+        except asyncio.CancelledError:
+            # Stopped mid-write (unload/restart): keep the batch for the final flush in async_stop
+            self._requeue(batch)
+            raise
+        except ClientResponseError as err:
+            if 400 <= err.status < 500 and err.status != 429:
+                # The sink rejected the data itself; retrying would block every newer sample
+                self.flush_errors += 1
+                self.samples_dropped += len(batch)
+                _LOGGER.warning(
+                    "Exporter sink rejected %d samples (HTTP %s), dropping them: %s",
+                    len(batch),
+                    err.status,
+                    err.message,
+                )
+                return True
+            self._on_write_failed(batch, err)
+            return False
+        except (asyncio.TimeoutError, ClientError, OSError) as err:
+            self._on_write_failed(batch, err)
+            return False
+        self.samples_written += len(batch)
+        self._evicting = False
+        return True
+
+
+    def _on_write_failed(self, batch: list[tuple[int, dict[str, Any]]], err: Exception) -> None:
+        # Slow or failing sink: put the batch back and retry on the next interval
+        self.flush_errors += 1
+        self._requeue(batch)
+        _LOGGER.warning(
+            "Exporter write failed, %d samples pending (%d dropped so far): %s",
+            len(self._buffer),
+            self.samples_dropped,
+            err,
+        )
+
+    def _requeue(self, batch: list[tuple[int, dict[str, Any]]]) -> None:
+        """Put a batch back at the front; only what still fits is kept, the oldest are dropped."""
+        room = self._buffer.maxlen - len(self._buffer)
+        keep = batch[len(batch) - room :] if room < len(batch) else batch
+        self.samples_dropped += len(batch) - len(keep)
+        self._buffer.extendleft(reversed(keep))
+
+
+def sample_to_lines(data: dict[str, Any], source: str, ts_ns: int) -> list[str]:
+    """Convert one coordinator snapshot into InfluxDB line-protocol lines."""
+    lines: list[str] = []
+    tags = f"source={_escape_tag(source)}"
+
+    for section in _SECTIONS:
+        values = data.get(section)
+        if not isinstance(values, dict):
+            continue
+        fields = _format_fields(values)
+        if fields:
+            lines.append(f"{DOMAIN}_{section},{tags} {fields} {ts_ns}")
+
+    sensors = data.get("sensors")
+    if isinstance(sensors, dict):
+        for key, meta in sensors.items():
+            if not isinstance(meta, dict):
+                continue
+            fields = _format_fields(_sensor_fields(meta.get("state")))
+            if fields:
+                lines.append(f"{DOMAIN}_sensor,{tags},sensor={_escape_tag(str(key))} {fields} {ts_ns}")
+
+    return lines
+
+
+def _sensor_fields(state: Any) -> dict[str, Any]:
+    """Split a sensor state into a numeric `value` or a textual `text` field.
+
+    InfluxDB rejects a field whose type changes within a measurement, and sensors
+    share one measurement, so numbers and text must never share a field name.
+    """
+    if isinstance(state, bool):
+        return {"value": float(state)}
+    if isinstance(state, (int, float)):
+        return {"value": state}
+    if isinstance(state, str):
+        try:
+            return {"value": float(state)}
+        except ValueError:
+            return {"text": state}
+    return {}
+
+
+def _format_fields(values: dict[str, Any]) -> str:
+    parts: list[str] = []
+    for key, val in values.items():
+        if isinstance(val, bool):
+            formatted = "true" if val else "false"
+        elif isinstance(val, (int, float)):
+            if not math.isfinite(val):
+                continue
+            # Export all numbers as floats so field types stay stable across polls
+            formatted = repr(float(val))
+        elif isinstance(val, str):
+            formatted = '"' + val.replace("\\", "\\\\").replace('"', '\\"') + '"'
+        else:
+            continue
+        parts.append(f"{_escape_tag(str(key))}={formatted}")
+    return ",".join(parts)
+
+
+def _escape_tag(value: str) -> str:
+    return value.replace("\\", "\\\\").replace(",", "\\,").replace("=", "\\=").replace(" ", "\\ ")
@@ -0,0 +1,185 @@
+"""On-demand profiling of the integration's update and control paths."""
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import io
+import logging
+import os
+import pstats
+import re
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+_LOGGER = logging.getLogger(__name__)
+
+# cProfile hooks the whole event loop thread, so only one session may run at a time
+_SESSION_LOCK = asyncio.Lock()
+
+_TOP_N = 25
+
+
+class PhaseTimings:
+    """Accumulate wall time per phase (network, decode, normalize, ...) while a session is active."""
+
+    def __init__(self) -> None:
+        self.active = False
+        self._totals: dict[str, float] = {}
+        self._counts: dict[str, int] = {}
+        self._max: dict[str, float] = {}
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        if not self.active:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - start)
+
+    def record(self, phase: str, seconds: float) -> None:
+        if not self.active:
+            return
+        self._totals[phase] = self._totals.get(phase, 0.0) + seconds
+        self._counts[phase] = self._counts.get(phase, 0) + 1
+        self._max[phase] = max(self._max.get(phase, 0.0), seconds)
+
+    def start(self) -> None:
+        self._totals.clear()
+        self._counts.clear()
+        self._max.clear()
+        self.active = True
+
+    def stop(self) -> dict[str, dict[str, float]]:
+        self.active = False
+        return {
+            phase: {
+                "calls": self._counts[phase],
+                "total_ms": total * 1000,
+                "avg_ms": total * 1000 / self._counts[phase],
+                "max_ms": self._max[phase] * 1000,
+            }
+            for phase, total in sorted(self._totals.items(), key=lambda kv: kv[1], reverse=True)
+        }
+
+
+class LoopBudget:
+    """Per-cycle accounting of time spent holding the event loop, by phase.
+
+    Work is only charged between start() and finish(); holds outside an open cycle are ignored.
+    """
+
+    def __init__(self, budget_ms: float = 0) -> None:
+        self.budget_ms = budget_ms
+        self._phases: dict[str, float] = {}
+        self._open = False
+        self.over_budget_cycles = 0
+        self.last_cycle: dict[str, float] = {}
+
+    @contextmanager
+    def hold(self, phase: str) -> Iterator[None]:
+        """Wrap synchronous (non-awaiting) work that runs on the event loop."""
+        if not self._open:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phases[phase] = self._phases.get(phase, 0.0) + time.perf_counter() - start
+
+    def start(self) -> None:
+        self._phases.clear()
+        self._open = True
+
+    def finish(self, name: str) -> None:
+        """Close the cycle and warn when its on-loop time exceeded the budget."""
+        if not self._open:
+            return
+        self._open = False
+        self.last_cycle = {phase: secs * 1000 for phase, secs in self._phases.items()}
+        self._phases.clear()
+        total_ms = sum(self.last_cycle.values())
+        breakdown = ", ".join(f"{phase}={ms:.1f} ms" for phase, ms in self.last_cycle.items())
+        _LOGGER.debug("%s held the event loop for %.1f ms: %s", name, total_ms, breakdown)
+        if self.budget_ms and total_ms > self.budget_ms:
+            self.over_budget_cycles += 1
+            _LOGGER.warning(
+                "%s held the event loop for %.1f ms (budget %.0f ms): %s",
+                name,
+                total_ms,
+                self.budget_ms,
+                breakdown,
+            )
+
+
+async def async_profile(
+    hass: HomeAssistant,
+    timings: dict[str, PhaseTimings],
+    duration: float,
+) -> tuple[str, str]:
+    """Profile the event loop for `duration` seconds and collect per-entry phase timings.
+
+    Returns (profile_path, summary_path).
+    """
+    if _SESSION_LOCK.locked():
+        raise HomeAssistantError("A SolarEdgeController profiling session is already running.")
+
+    async with _SESSION_LOCK:
+        profile = cProfile.Profile()
+        for t in timings.values():
+            t.start()
+        profile.enable()
+        try:
+            await asyncio.sleep(duration)
+        finally:
+            profile.disable()
+            phases = {entry_id: t.stop() for entry_id, t in timings.items()}
+
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    profile_path = hass.config.path(f"solaredgecontroller_profile.{stamp}.prof")
+    summary_path = hass.config.path(f"solaredgecontroller_profile.{stamp}.txt")
+
+    # pstats sorting and file writes are blocking; keep them off the event loop
+    await hass.async_add_executor_job(_write_results, profile, phases, duration, profile_path, summary_path)
+    _LOGGER.info("Profile written to %s (summary: %s)", profile_path, summary_path)
+    return profile_path, summary_path
+
+
+def _write_results(
+    profile: cProfile.Profile,
+    phases: dict[str, dict[str, dict[str, float]]],
+    duration: float,
+    profile_path: str,
+    summary_path: str,
+) -> None:
+    profile.dump_stats(profile_path)
+
+    out = io.StringIO()
+    out.write(f"SolarEdgeController profile ({duration:.0f} s)\n\n")
+    out.write("Per-phase timings\n")
+    for entry_id, entry_phases in phases.items():
+        out.write(f"  {entry_id}\n")
+        if not entry_phases:
+            out.write("    (no activity)\n")
+        for phase, s in entry_phases.items():
+            out.write(
+                f"    {phase:<14} calls={s['calls']:<5.0f} total={s['total_ms']:9.2f} ms "
+                f"avg={s['avg_ms']:8.2f} ms max={s['max_ms']:8.2f} ms\n"
+            )
+
+    out.write(f"\nTop {_TOP_N} hot spots in this integration (cumulative)\n")
+    stats = pstats.Stats(profile, stream=out)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(re.escape(os.path.dirname(__file__)), _TOP_N)
+
+    out.write(f"\nTop {_TOP_N} hot spots on the event loop (own time)\n")
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(_TOP_N)
+
+    with open(summary_path, "w", encoding="utf-8") as fh:
+        fh.write(out.getvalue())
@@ -11,6 +11,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import SolarEdgeControllerCoordinator
+from .profiler import LoopBudget
 
 
 async def async_setup_entry(
@@ -22,10 +23,21 @@ async def async_setup_entry(
     coordinator: SolarEdgeControllerCoordinator = data["coordinator"]
 
     sensors = coordinator.data.get("sensors", {}) if coordinator.data else {}
-    entities: list[SolarEdgeControllerSensor] = [
-        SolarEdgeControllerSensor(coordinator, entry, key) for key in sensors.keys()
-    ]
-    async_add_entities(entities)
+
+    # Separate budget so setup never mixes with (or resets) an update cycle already in progress
+    setup_budget = LoopBudget(coordinator.api.loop_budget.budget_ms)
+    setup_budget.start()
+    with setup_budget.hold("entity_setup"):
+        entities: list[SensorEntity] = [
+            SolarEdgeControllerSensor(coordinator, entry, key) for key in sensors.keys()
+        ]
+        if coordinator.poll_stats["aligned"]:
+            entities.append(SolarEdgeControllerPollJitterSensor(coordinator, entry))
+        if coordinator.exporter is not None:
+            entities.append(SolarEdgeControllerExporterSensor(coordinator, entry))
+        entities.append(SolarEdgeControllerDedupSensor(coordinator, entry))
+        async_add_entities(entities)
+    setup_budget.finish(f"{entry.title} sensor setup")
 
 
 class SolarEdgeControllerSensor(CoordinatorEntity[SolarEdgeControllerCoordinator], SensorEntity):
@@ -98,6 +110,109 @@ class SolarEdgeControllerSensor(CoordinatorEntity[SolarEdgeControllerCoordinator
         )
 
 
+class SolarEdgeControllerPollJitterSensor(CoordinatorEntity[SolarEdgeControllerCoordinator], SensorEntity):
+    """p95 start jitter of clock-aligned polls; full stats are exposed as attributes."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_native_unit_of_measurement = "ms"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:timer-outline"
+
+    def __init__(self, coordinator: SolarEdgeControllerCoordinator, entry: ConfigEntry) -> None:
+        super().__init__(coordinator)
+        self._entry = entry
+        self._attr_name = "SolarEdge Poll jitter"
+        self._attr_unique_id = f"{entry.entry_id}_poll_jitter"
+
+    @property
+    def native_value(self) -> float | None:
+        p95 = self.coordinator.poll_stats["jitter_p95_ms"]
+        return round(p95, 1) if p95 is not None else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        stats = self.coordinator.poll_stats
+        timing = (self.coordinator.data or {}).get("timing") or {}
+        return {
+            "missed_deadlines": stats["missed_deadlines"],
+            "polls": stats["polls"],
+            "jitter_p50_ms": stats["jitter_p50_ms"],
+            "jitter_p99_ms": stats["jitter_p99_ms"],
+            "jitter_max_ms": stats["jitter_max_ms"],
+            "last_latency_ms": timing["latency_s"] * 1000 if "latency_s" in timing else None,
+        }
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        return DeviceInfo(
+            identifiers={(DOMAIN, self._entry.unique_id or self._entry.entry_id)},
+            name="SolarEdgeController",
+            manufacturer="SolarEdge",
+        )
+
+
+class SolarEdgeControllerExporterSensor(CoordinatorEntity[SolarEdgeControllerCoordinator], SensorEntity):
+    """Samples dropped by the time-series exporter; buffer and write counters are exposed as attributes."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_icon = "mdi:database-export-outline"
+
+    def __init__(self, coordinator: SolarEdgeControllerCoordinator, entry: ConfigEntry) -> None:
+        super().__init__(coordinator)
+        self._entry = entry
+        self._attr_name = "SolarEdge Exporter dropped samples"
+        self._attr_unique_id = f"{entry.entry_id}_exporter_dropped"
+
+    @property
+    def native_value(self) -> int | None:
+        exporter = self.coordinator.exporter
+        return exporter.samples_dropped if exporter is not None else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        exporter = self.coordinator.exporter
+        return exporter.stats if exporter is not None else {}
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        return DeviceInfo(
+            identifiers={(DOMAIN, self._entry.unique_id or self._entry.entry_id)},
+            name="SolarEdgeController",
+            manufacturer="SolarEdge",
+        )
+
+
+class SolarEdgeControllerDedupSensor(CoordinatorEntity[SolarEdgeControllerCoordinator], SensorEntity):
+    """GETs that joined an in-flight request instead of issuing their own."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_icon = "mdi:call-merge"
+
+    def __init__(self, coordinator: SolarEdgeControllerCoordinator, entry: ConfigEntry) -> None:
+        super().__init__(coordinator)
+        self._entry = entry
+        self._attr_name = "SolarEdge Deduplicated requests"
+        self._attr_unique_id = f"{entry.entry_id}_deduplicated_requests"
+
+    @property
+    def native_value(self) -> int:
+        return self.coordinator.api.deduplicated_requests
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        return self.coordinator.api.request_stats
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        return DeviceInfo(
+            identifiers={(DOMAIN, self._entry.unique_id or self._entry.entry_id)},
+            name="SolarEdgeController",
+            manufacturer="SolarEdge",
+        )
+
+
 def _safe_enum(enum_cls: Any, value: Any) -> Any:
     if value is None:
         return None